@@ -13,7 +13,9 @@ Example usage:
 """
 
 from .orchestrator import Orchestrator, build_demo
+from .events import Ev
 from .models import Station, Slide
+from .clock import SimClock
 from .robot_arm import RobotArm
 from .opentrons import Opentrons  
 from .microscope import Microscope
@@ -29,6 +31,7 @@ __author__ = "Smart Arkitekt Team"
 
 __all__ = [
     # Core workflow components
+    "Ev",
     "Station",
     "Slide", 
     "RobotArm",
@@ -37,6 +40,7 @@ __all__ = [
     "ImageProcessor",
     "Orchestrator",
     "build_demo",
+    "SimClock",
     
     # Visualization components
     "MatplotlibVisualizer",
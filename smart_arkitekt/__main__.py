@@ -1,24 +1,26 @@
 #!/usr/bin/env python3
 """
-Demo script for the multi-device workflow orchestrator.
+Demo entry point for the multi-device workflow orchestrator.
 
-Runs the complete workflow with slides [1,2,3,4] and demonstrates:
+Run with ``python -m smart_arkitekt``. Demonstrates:
 - Multi-device coordination (Robot, Opentrons, Microscope, Image Processor)
 - Protocol-based staining workflow
-- Quality evaluation with wash loops  
+- Quality evaluation with wash loops
 - Live visualization with active station display
 - Event emission and logging
 """
 
 import time
 from typing import List
-from smart_arkitekt import build_demo
-def run_demo(slide_ids: List[int] = None, max_wash_loops: int = 2, 
+
+from . import build_demo
+
+def run_demo(slide_ids: List[int] = None, max_wash_loops: int = 2,
              use_matplotlib: bool = True, save_frames: bool = False,
              headless: bool = None):
     """
     Run the complete workflow demonstration.
-    
+
     Args:
         slide_ids: List of slide IDs to process (default: [1,2,3,4])
         max_wash_loops: Maximum number of wash attempts per slide
@@ -28,36 +30,36 @@ def run_demo(slide_ids: List[int] = None, max_wash_loops: int = 2,
     """
     if slide_ids is None:
         slide_ids = [1, 2, 3, 4]
-        
+
     print(f"🔬 Multi-Device Workflow Demo")
     print(f"   Slides: {slide_ids}")
     print(f"   Max wash loops: {max_wash_loops}")
     print(f"   Visualization: {'Matplotlib' if use_matplotlib else 'Console'}")
     print("=" * 50)
-    
+
     try:
         # Create orchestrator with visualization
         orchestrator = build_demo(
             max_wash_loops=max_wash_loops,
-            use_matplotlib=use_matplotlib, 
+            use_matplotlib=use_matplotlib,
             headless=headless,
             save_frames=save_frames
         )
-        
+
         # Run the workflow
         start_time = time.time()
         orchestrator.run(slide_ids)
         end_time = time.time()
-        
+
         print("=" * 50)
         print(f"✅ Workflow completed successfully!")
         print(f"   Total time: {end_time - start_time:.2f} seconds")
         print(f"   Processed {len(slide_ids)} slides")
-        
+
         if save_frames:
             frame_count = getattr(orchestrator._visualizer, 'frame_count', 0)
             print(f"   Generated {frame_count} visualization frames in /tmp/")
-            
+
     except KeyboardInterrupt:
         print("\n⚠️  Workflow interrupted by user")
     except Exception as e:
@@ -69,15 +71,15 @@ def run_demo(slide_ids: List[int] = None, max_wash_loops: int = 2,
             orchestrator._visualizer.close()
 
 def main():
-    """Main entry point with command line argument parsing"""
-    
+    """Main entry point"""
+
     run_demo(
-        slide_ids=[1,2,3], 
+        slide_ids=[1,2,3],
         max_wash_loops=2,
         use_matplotlib=1,
-        save_frames=0, 
-        headless=False        
+        save_frames=0,
+        headless=False
     )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,38 @@
+"""
+Simulated clock for device latency.
+
+Devices sleep through a shared SimClock instead of calling asyncio.sleep
+directly, so simulations can run against real wall-clock time, sped-up
+time, or pure virtual time (fast mode) without touching device code.
+"""
+
+import asyncio
+
+class SimClock:
+    """
+    Clock that devices use to simulate operation latency.
+
+    In normal mode ``sleep`` awaits real wall-clock time, divided by
+    ``speedup``. In fast mode it only advances the virtual ``now``
+    counter and yields once to the event loop, so a whole workflow
+    finishes in milliseconds while task interleaving is preserved.
+    """
+
+    def __init__(self, speedup: float = 1.0, fast: bool = False):
+        self.speedup = speedup
+        self.fast = fast
+        self.now = 0.0
+
+    async def sleep(self, duration: float):
+        """
+        Simulate `duration` seconds of device latency.
+
+        Args:
+            duration: Nominal device latency in seconds
+        """
+        self.now += duration
+        if self.fast:
+            # Yield so concurrent device tasks still interleave
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(duration / self.speedup)
@@ -0,0 +1,84 @@
+"""
+Event protocol shared by devices, orchestrator and visualizers.
+
+Events are emitted as ``emit(code, payload)`` where ``code`` is an
+:class:`Ev` integer and payload is a plain tuple of positional values.
+Parallel tuples indexed by the code (NAMES, FIELDS, STATIONS) hold each
+event's dotted name, payload field names and station prefix, so
+hot-path consumers index an array instead of splitting and formatting
+the event name per emit.
+"""
+
+from enum import IntEnum
+from typing import Dict
+
+# One row per event: (dotted name, payload field names). Row order
+# defines the Ev code; enum member names are derived from the dotted
+# name ("robot.move_start" -> Ev.ROBOT_MOVE_START).
+_EVENTS = (
+    # Robot arm
+    ("robot.move_start", ()),
+    ("robot.move_pickup", ("slot",)),
+    ("robot.close_gripper", ()),
+    ("robot.open_gripper", ()),
+    ("robot.move_rack_to_opentrons", ("slide", "opentrons_slot")),
+    ("robot.move_opentrons_to_microscope", ("slide", "opentrons_slot")),
+    ("robot.move_microscope_to_opentrons", ("slide", "opentrons_slot")),
+    ("robot.move_microscope_to_image_processor", ("slide",)),
+    ("robot.move_image_processor_to_dropoff", ("slide", "dropoff_slot")),
+    ("robot.move_microscope_to_dropoff", ("slide", "dropoff_slot")),
+    ("robot.move_idle_to_opentrons", ("slide", "opentrons_slot")),
+    ("robot.move_idle_to_microscope", ("slide",)),
+    ("robot.safety", ()),
+
+    # Opentrons
+    ("opentrons.stain", ("slide", "slot", "protocol")),
+    ("opentrons.wash", ("slide", "slot", "protocol")),
+    ("opentrons.protocol_set", ("protocol",)),
+
+    # Microscope
+    ("microscope.safety", ()),
+    ("microscope.evaluate", ("slide",)),
+    ("microscope.scan", ("slide",)),
+
+    # Image processor
+    ("image_processor.start_processing", ("slide",)),
+    ("image_processor.analyze_antibodies", ("slide",)),
+    ("image_processor.antibody_results", ("slide", "results")),
+    ("image_processor.identify_cancer", ("slide",)),
+    ("image_processor.cancer_results", ("slide", "results")),
+    ("image_processor.generate_report", ("slide",)),
+    ("image_processor.report_complete", ("slide", "report")),
+    ("image_processor.processing_complete", ("slide",)),
+
+    # Orchestrator / system-wide
+    ("arkitekt.workflow_start", ("slides", "protocols")),
+    ("arkitekt.protocol_start", ("protocol", "protocol_index", "total_protocols")),
+    ("arkitekt.protocol_complete", ("protocol",)),
+    ("arkitekt.slide_protocol_start", ("slide", "protocol", "is_final")),
+    ("arkitekt.slide_complete", ("slide", "loops", "analysis")),
+    ("arkitekt.slide_failed", ("slide", "loops", "reason")),
+    ("arkitekt.workflow_complete", ()),
+)
+
+Ev = IntEnum("Ev", [(name.replace(".", "_").upper(), code)
+                    for code, (name, _fields) in enumerate(_EVENTS)])
+Ev.__doc__ = """Integer event codes, one per emitted event kind."""
+
+# Parallel lookup tables indexed by Ev code
+NAMES = tuple(name for name, _fields in _EVENTS)
+FIELDS = tuple(fields for _name, fields in _EVENTS)
+STATIONS = tuple(name.split(".", 1)[0] for name, _fields in _EVENTS)
+
+def payload_to_dict(code: int, payload: tuple) -> Dict:
+    """
+    Rebuild a field-name mapping for an emitted payload tuple.
+
+    Args:
+        code: Event code as passed to emit
+        payload: Positional payload tuple
+
+    Returns:
+        Dict of field name -> value
+    """
+    return dict(zip(FIELDS[code], payload))
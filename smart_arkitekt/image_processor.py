@@ -3,10 +3,19 @@ Image Processing station for analyzing microscopy data.
 Implements cancer detection and antibody analysis functionality.
 """
 
+import asyncio
 import time
-import random
 from typing import Callable, Dict, Optional
 
+import numpy as np
+
+from .clock import SimClock
+from .events import Ev
+
+# Malignancy grades indexed by a uniform integer draw; cheaper than
+# rng.choice on a fresh list per slide.
+_GRADES = ("low", "medium", "high")
+
 class ImageProcessor:
     """
     Image processing station for advanced analysis of microscopy data.
@@ -18,10 +27,14 @@ class ImageProcessor:
     - Report generation for downstream analysis
     """
     
-    def __init__(self, emit: Callable[[str, Dict], None]):
+    __slots__ = ("emit", "clock", "_rng")
+
+    def __init__(self, emit: Callable[[int, tuple], None], clock: SimClock = None):
         self.emit = emit
+        self.clock = clock or SimClock()
+        self._rng = np.random.default_rng()
 
-    def analyze_antibodies(self, slide_id: int) -> Dict[str, float]:
+    async def analyze_antibodies(self, slide_id: int) -> Dict[str, float]:
         """
         Analyze antibody staining levels and distribution.
         
@@ -31,25 +44,25 @@ class ImageProcessor:
         Returns:
             Dictionary with antibody analysis results
         """
-        self.emit("image_processor.analyze_antibodies", {"slide": slide_id})
-        time.sleep(0.3)  # Simulate analysis time
+        self.emit(Ev.IMAGE_PROCESSOR_ANALYZE_ANTIBODIES, (slide_id,))
+        await self.clock.sleep(0.3)  # Simulate analysis time
         
-        # Mock analysis results - in reality would be ML-based analysis
+        # Mock analysis results - in reality would be ML-based analysis.
+        # All four draws come from one vectorized Generator call.
+        coverage, intensity, uniformity, noise = self._rng.uniform(
+            [0.2, 0.3, 0.4, 0.05], [0.9, 1.0, 0.95, 0.3])
         results = {
-            "antibody_coverage": random.uniform(0.2, 0.9),
-            "staining_intensity": random.uniform(0.3, 1.0),
-            "uniformity_score": random.uniform(0.4, 0.95),
-            "background_noise": random.uniform(0.05, 0.3)
+            "antibody_coverage": float(coverage),
+            "staining_intensity": float(intensity),
+            "uniformity_score": float(uniformity),
+            "background_noise": float(noise)
         }
         
-        self.emit("image_processor.antibody_results", {
-            "slide": slide_id,
-            "results": results
-        })
+        self.emit(Ev.IMAGE_PROCESSOR_ANTIBODY_RESULTS, (slide_id, results))
         
         return results
 
-    def identify_cancer(self, slide_id: int) -> Dict[str, any]:
+    async def identify_cancer(self, slide_id: int) -> Dict[str, any]:
         """
         Identify and classify cancer cells in the slide.
         
@@ -59,27 +72,34 @@ class ImageProcessor:
         Returns:
             Dictionary with cancer detection results
         """
-        self.emit("image_processor.identify_cancer", {"slide": slide_id})
-        time.sleep(0.5)  # Simulate longer analysis time for cancer detection
+        self.emit(Ev.IMAGE_PROCESSOR_IDENTIFY_CANCER, (slide_id,))
+        await self.clock.sleep(0.5)  # Simulate longer analysis time for cancer detection
         
         # Mock cancer detection results
-        cancer_detected = random.random() > 0.6
-        results = {
-            "cancer_detected": cancer_detected,
-            "confidence_score": random.uniform(0.7, 0.99) if cancer_detected else random.uniform(0.1, 0.4),
-            "cell_count": random.randint(0, 150) if cancer_detected else 0,
-            "malignancy_grade": random.choice(["low", "medium", "high"]) if cancer_detected else None,
-            "tumor_area_percentage": random.uniform(5.0, 45.0) if cancer_detected else 0.0
-        }
-        
-        self.emit("image_processor.cancer_results", {
-            "slide": slide_id,
-            "results": results
-        })
+        cancer_detected = bool(self._rng.random() > 0.6)
+        if cancer_detected:
+            confidence, tumor_area = self._rng.uniform([0.7, 5.0], [0.99, 45.0])
+            results = {
+                "cancer_detected": True,
+                "confidence_score": float(confidence),
+                "cell_count": int(self._rng.integers(0, 151)),
+                "malignancy_grade": _GRADES[self._rng.integers(0, 3)],
+                "tumor_area_percentage": float(tumor_area)
+            }
+        else:
+            results = {
+                "cancer_detected": False,
+                "confidence_score": float(self._rng.uniform(0.1, 0.4)),
+                "cell_count": 0,
+                "malignancy_grade": None,
+                "tumor_area_percentage": 0.0
+            }
+        
+        self.emit(Ev.IMAGE_PROCESSOR_CANCER_RESULTS, (slide_id, results))
         
         return results
 
-    def generate_report(self, slide_id: int, antibody_results: Dict, cancer_results: Dict) -> Dict[str, any]:
+    async def generate_report(self, slide_id: int, antibody_results: Dict, cancer_results: Dict) -> Dict[str, any]:
         """
         Generate comprehensive analysis report combining all results.
         
@@ -91,8 +111,8 @@ class ImageProcessor:
         Returns:
             Complete analysis report
         """
-        self.emit("image_processor.generate_report", {"slide": slide_id})
-        time.sleep(0.1)
+        self.emit(Ev.IMAGE_PROCESSOR_GENERATE_REPORT, (slide_id,))
+        await self.clock.sleep(0.1)
         
         # Calculate overall quality score
         antibody_score = (antibody_results["antibody_coverage"] * 0.4 + 
@@ -108,18 +128,16 @@ class ImageProcessor:
             "status": "complete"
         }
         
-        self.emit("image_processor.report_complete", {
-            "slide": slide_id,
-            "report": report
-        })
+        self.emit(Ev.IMAGE_PROCESSOR_REPORT_COMPLETE, (slide_id, report))
         
         return report
 
-    def process_slide(self, slide_id: int) -> Dict[str, any]:
+    async def process_slide(self, slide_id: int) -> Dict[str, any]:
         """
         Complete processing workflow for a slide.
         
-        Performs antibody analysis, cancer detection, and report generation.
+        Performs antibody analysis and cancer detection concurrently,
+        then generates the combined report.
         
         Args:
             slide_id: ID of slide to process
@@ -127,13 +145,15 @@ class ImageProcessor:
         Returns:
             Complete analysis report
         """
-        self.emit("image_processor.start_processing", {"slide": slide_id})
+        self.emit(Ev.IMAGE_PROCESSOR_START_PROCESSING, (slide_id,))
         
-        # Perform all analyses
-        antibody_results = self.analyze_antibodies(slide_id)
-        cancer_results = self.identify_cancer(slide_id)
-        report = self.generate_report(slide_id, antibody_results, cancer_results)
+        # Antibody and cancer analyses are independent, so run them concurrently
+        antibody_results, cancer_results = await asyncio.gather(
+            self.analyze_antibodies(slide_id),
+            self.identify_cancer(slide_id)
+        )
+        report = await self.generate_report(slide_id, antibody_results, cancer_results)
         
-        self.emit("image_processor.processing_complete", {"slide": slide_id})
+        self.emit(Ev.IMAGE_PROCESSOR_PROCESSING_COMPLETE, (slide_id,))
         
         return report
\ No newline at end of file
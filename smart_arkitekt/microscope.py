@@ -2,50 +2,81 @@
 Microscope device implementation for slide evaluation and scanning.
 """
 
-import time
 import random
-from typing import Callable, Dict
+from typing import Callable
+
+from .clock import SimClock
+from .events import Ev
 
 class Microscope:
     """
     Microscope implementation for slide quality evaluation and high-resolution scanning.
+
+    All operations are coroutines so the orchestrator can overlap microscope
+    latency with work on other devices; legacy synchronous callers can wrap
+    calls in ``asyncio.run``.
     """
-    
-    def __init__(self, emit: Callable[[str, Dict], None]): 
+
+    __slots__ = ("emit", "clock", "_evaluator", "_rng", "_last_event")
+
+    def __init__(self, emit: Callable[[int, tuple], None], clock: SimClock = None,
+                 evaluator: Callable[[int], bool] = None):
         self.emit = emit
+        self.clock = clock or SimClock()
+        # Injectable quality policy; the default is a seeded placeholder
+        # so workflow runs are reproducible for benchmarking.
+        self._evaluator = evaluator
+        self._rng = random.Random(0)
+        self._last_event = None
 
-    def safety(self):
-        """Move microscope to safety position"""
-        self.emit("microscope.safety", {}); time.sleep(0.03)
+    async def safety(self, force: bool = False):
+        """
+        Move microscope to safety position.
+
+        Consecutive calls are debounced: if the stage has not done
+        anything since the last safety move it is already safe and the
+        command is skipped. Pass ``force=True`` for safety-critical
+        transitions that must always execute.
+        """
+        if not force and self._last_event == Ev.MICROSCOPE_SAFETY:
+            return
+        self._last_event = Ev.MICROSCOPE_SAFETY
+        self.emit(Ev.MICROSCOPE_SAFETY, ()); await self.clock.sleep(0.03)
 
-    def evaluate(self, slide_id: int) -> bool:
+    async def evaluate(self, slide_id: int) -> bool:
         """
         Evaluate slide quality using low-magnification preview.
-        
+
         This is a quick evaluation to determine if the staining quality
         is sufficient to proceed with full scanning or if washing is needed.
-        
+
+        The decision comes from the injected evaluator when one was
+        given (e.g. an Arkitekt-driven analysis or a test policy),
+        otherwise from the seeded placeholder heuristic.
+
         Args:
             slide_id: ID of slide to evaluate
-            
+
         Returns:
             True if quality is acceptable, False if washing is needed
         """
-        self.emit("microscope.evaluate", {"slide": slide_id})
-        time.sleep(0.1)
-        
-        # Placeholder heuristic: progressively more likely to be OK after washes
-        # In real implementation, this would be replaced with Arkitekt-driven analysis
-        return bool(random.random() > 0.4)
-
-    def scan_slide(self, slide_id: int):
+        self._last_event = Ev.MICROSCOPE_EVALUATE
+        self.emit(Ev.MICROSCOPE_EVALUATE, (slide_id,))
+        await self.clock.sleep(0.1)
+
+        if self._evaluator is not None:
+            return self._evaluator(slide_id)
+        return bool(self._rng.random() > 0.4)
+
+    async def scan_slide(self, slide_id: int):
         """
         Perform full high-resolution scan of slide.
-        
+
         This captures the final images for analysis after quality evaluation
         has determined the slide is ready.
-        
+
         Args:
             slide_id: ID of slide to scan
         """
-        self.emit("microscope.scan", {"slide": slide_id}); time.sleep(0.25)
\ No newline at end of file
+        self._last_event = Ev.MICROSCOPE_SCAN
+        self.emit(Ev.MICROSCOPE_SCAN, (slide_id,)); await self.clock.sleep(0.25)
@@ -3,11 +3,15 @@ Domain models for the workflow orchestrator.
 """
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional
 
-class Station(Enum):
-    """Available stations in the workflow"""
+class Station(IntEnum):
+    """Available stations in the workflow
+
+    An IntEnum so hot-path dict lookups and comparisons work on plain
+    integers; display names come from ``Station.name``.
+    """
     RACK = auto()
     ROBOT = auto() 
     OPENTRONS = auto()
@@ -15,7 +19,7 @@ class Station(Enum):
     IMAGE_PROCESSOR = auto()
     DROPOFF = auto()
 
-@dataclass
+@dataclass(slots=True)
 class Slide:
     """Represents a slide being processed"""
     id: int
@@ -2,55 +2,57 @@
 Opentrons OT-2 device implementation for staining and washing protocols.
 """
 
-import time
-from typing import Callable, Dict
+from typing import Callable
+
+from .clock import SimClock
+from .events import Ev
 
 class Opentrons:
     """
     Opentrons OT-2 implementation for automated staining and washing.
     Supports multiple protocols for different antibody staining steps.
+
+    Protocol runs are coroutines so staining latency can be overlapped with
+    other devices; legacy synchronous callers can wrap calls in ``asyncio.run``.
     """
-    
-    def __init__(self, emit: Callable[[str, Dict], None]): 
+
+    __slots__ = ("emit", "clock", "current_protocol")
+
+    def __init__(self, emit: Callable[[int, tuple], None], clock: SimClock = None):
         self.emit = emit
+        self.clock = clock or SimClock()
         self.current_protocol = "NONE"
 
-    def run_staining_protocol(self, slide_id: int, slot: int, protocol: str = None):
+    async def run_staining_protocol(self, slide_id: int, slot: int, protocol: str = None):
         """
         Run staining protocol on slide.
-        
+
         Args:
             slide_id: ID of slide being stained
             slot: Opentrons slot number
             protocol: Protocol name (e.g. "Receptor42", "Receptor0815")
         """
         protocol_name = protocol or self.current_protocol
-        self.emit("opentrons.stain", {
-            "slide": slide_id, 
-            "slot": slot,
-            "protocol": protocol_name
-        }); time.sleep(0.2)
+        self.emit(Ev.OPENTRONS_STAIN, (slide_id, slot, protocol_name)); await self.clock.sleep(0.2)
 
-    def run_washing_protocol(self, slide_id: int, slot: int):
+    async def run_washing_protocol(self, slide_id: int, slot: int, protocol: str = None):
         """
         Run washing protocol to clean slide.
-        
+
         Args:
             slide_id: ID of slide being washed
             slot: Opentrons slot number
+            protocol: Protocol being washed out (e.g. "Receptor0815")
         """
-        self.emit("opentrons.wash", {
-            "slide": slide_id, 
-            "slot": slot,
-            "protocol": self.current_protocol
-        }); time.sleep(0.15)
-        
+        protocol_name = protocol or self.current_protocol
+        self.emit(Ev.OPENTRONS_WASH, (slide_id, slot, protocol_name)); await self.clock.sleep(0.15)
+
     def set_protocol(self, protocol: str):
         """
         Set the current protocol for staining operations.
-        
+
         Args:
             protocol: Protocol name (e.g. "Receptor42", "Receptor0815")
         """
         self.current_protocol = protocol
-        self.emit("opentrons.protocol_set", {"protocol": protocol})
\ No newline at end of file
+        self.emit(Ev.OPENTRONS_PROTOCOL_SET, (protocol,))
@@ -3,46 +3,101 @@ Multi-device workflow orchestrator for Arkitekt.
 
 Implements a state-machine that executes slide workflow across multiple devices:
 - Robot Arm: handles slide movement between stations
-- Opentrons: runs staining and washing protocols  
+- Opentrons: runs staining and washing protocols
 - Microscope: evaluates slide quality and performs full scans
 - Image Processor: analyzes antibodies and detects cancer
 
 Supports protocol-based workflows, configurable wash loops, and provides hooks for
 Arkitekt task integration with live visualization.
+
+Each slide's workflow is expressed as named :class:`~.scheduler.Step`
+objects run through a :class:`~.scheduler.Scheduler`; steps occupy the
+devices they declare, so while one slide is on the microscope the next
+can already be staining on the Opentrons. The wash loop is a
+conditional branch: its steps are only submitted once an evaluation
+result is known.
 """
 
-from typing import Callable, Dict, List, Optional
-import time
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+
+import numpy as np
 
+from .clock import SimClock
+from .events import Ev
 from .models import Slide, Station
 from .robot_arm import RobotArm
 from .opentrons import Opentrons
 from .microscope import Microscope
 from .image_processor import ImageProcessor
-from .visualizer import ConsoleVisualizer
+from .scheduler import Scheduler, Step
+from .visualizer import create_visualizer
+
+# Slide id used while tracing a workflow in compile_plan; replaced by
+# the real id when a compiled plan is replayed.
+_TRACE_ID = -1
+
+# Physical devices that can only serve one slide at a time; each gets its
+# own asyncio.Lock so independent slides pipeline across free devices.
+# Opentrons units are not listed here: they are drawn from a pool at
+# step runtime so several can stain different slides concurrently.
+_DEVICES = ("robot", "microscope", "image_processor")
+
+class _TraceDevice:
+    """
+    Stand-in device used by :meth:`Orchestrator.compile_plan`.
+
+    Records every method call as ``(device, method, args, kwargs,
+    expected)`` instead of executing it; ``evaluate`` returns the next
+    scripted outcome so the wash loop unrolls to exactly the compiled
+    wash count. Tracing a workflow against these is how a plan is built
+    without touching real hardware or sleeping.
+    """
+
+    __slots__ = ("_name", "_calls", "_outcomes")
+
+    def __init__(self, name, calls, outcomes=None):
+        self._name = name
+        self._calls = calls
+        self._outcomes = outcomes
+
+    def __getattr__(self, method):
+        async def call(*args, **kwargs):
+            expected = next(self._outcomes) if method == "evaluate" else None
+            self._calls.append((self._name, method, args, kwargs, expected))
+            return expected
+        return call
 
 class Orchestrator:
     """
     Main orchestrator for multi-device workflows.
-    
+
     Coordinates all devices to execute a complete slide processing workflow
-    with protocol-based staining (all slides get protocol 1, then all get protocol 2, etc).
+    with protocol-based staining (every slide walks the full protocol
+    sequence, with slides pipelined across the devices).
     """
-    
+
     def __init__(self,
                  robot: RobotArm,
-                 opentrons: Opentrons,
+                 opentrons: Union[Opentrons, List[Opentrons]],
                  microscope: Microscope,
                  image_processor: ImageProcessor,
-                 emit: Callable[[str, Dict], None],
+                 emit: Callable[[int, tuple], None],
                  max_wash_loops: int = 2,
                  pickup_slot: int = 1,
                  ot_slot: int = 1,
-                 dropoff_slot: int = 1, 
+                 dropoff_slot: int = 1,
+                 wash_in_place: bool = False,
                  protocols: List[str] = None):
-        
+
         self.robot = robot
-        self.opentrons = opentrons
+        # A single Opentrons or a pool of them; with several units,
+        # independent slides stain in parallel on whichever is free
+        self.opentrons_pool = (list(opentrons)
+                               if isinstance(opentrons, (list, tuple))
+                               else [opentrons])
+        self.opentrons = self.opentrons_pool[0]
         self.microscope = microscope
         self.image_processor = image_processor
         self.emit = emit
@@ -50,219 +105,490 @@ class Orchestrator:
         self.pickup_slot = pickup_slot
         self.ot_slot = ot_slot
         self.dropoff_slot = dropoff_slot
+        # Setups with fluid delivery at the microscope stage can wash
+        # without the robot round-trip back to the Opentrons
+        self.wash_in_place = wash_in_place
         self.protocols = protocols or ["Receptor42", "Receptor0815"]
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._sched: Optional[Scheduler] = None
+        # Compiled replay plans keyed by (is_final_protocol, wash_loops)
+        self._plans: Dict[Tuple[bool, int], list] = {}
 
     def run(self, slide_ids: List[int]):
         """
         Execute complete multi-protocol workflow for all slides.
-        
-        Protocol-based workflow: all slides are processed with protocol 1,
-        then all slides are processed with protocol 2, etc.
-        
+
+        Synchronous entry point for legacy callers; wraps :meth:`run_async`
+        in ``asyncio.run``.
+
+        Args:
+            slide_ids: List of slide IDs to process
+        """
+        asyncio.run(self.run_async(slide_ids))
+
+    async def run_async(self, slide_ids: List[int]):
+        """
+        Execute complete multi-protocol workflow for all slides.
+
+        Every slide runs its protocol sequence concurrently with the
+        others, pipelined across devices: protocol boundaries are not
+        global barriers, so no device idles waiting for the slowest slide
+        of the previous protocol.
+
         Args:
             slide_ids: List of slide IDs to process
         """
-        self.emit("arkitekt.workflow_start", {
-            "slides": slide_ids,
-            "protocols": self.protocols
-        })
+        self._bind_loop()
+
+        self.emit(Ev.ARKITEKT_WORKFLOW_START, (slide_ids, self.protocols))
+
+        # Slide-major pipelining: each slide walks its full protocol
+        # sequence independently, so a slide can start protocol 2 while a
+        # slower one is still staining protocol 1. The protocol name is
+        # passed with each Opentrons call, so no device-global protocol
+        # state has to be synchronized between slides.
+        await asyncio.gather(*(
+            self._process_slide(slide_id) for slide_id in slide_ids
+        ))
+
+        # Workflow is over: execute any buffered arm commands and park
+        await self.robot.flush()
+
+        self.emit(Ev.ARKITEKT_WORKFLOW_COMPLETE, ())
+
+    def _bind_loop(self):
+        """
+        Create locks, scheduler and the free-Opentrons queue.
+
+        Called lazily (not in ``__init__``) so repeated run() calls
+        each bind to their own event loop.
+        """
+        self._locks = {device: asyncio.Lock() for device in _DEVICES}
+        self._sched = Scheduler(self._locks, _DEVICES)
+        self._ot_free: asyncio.Queue = asyncio.Queue()
+        for ot in self.opentrons_pool:
+            self._ot_free.put_nowait(ot)
+
+    def plan(self, slide_ids: List[int], p_ok: float = 0.6,
+             rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Pre-plan wash-loop counts for a batch of slides without running devices.
+
+        Draws every evaluation outcome for all slides in one vectorized
+        call and finds each slide's first passing evaluation, so
+        parametric sweeps over thousands of slides cost a single numpy
+        pass instead of a Python retry loop per slide.
+
+        Args:
+            slide_ids: Slides to plan for (only the count matters)
+            p_ok: Per-evaluation pass probability of the quality model
+            rng: Optional numpy Generator for reproducible plans
+
+        Returns:
+            Wash loops needed per slide; ``max_wash_loops + 1`` marks a
+            slide that fails out after exhausting its wash attempts
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        attempts = self.max_wash_loops + 1
+        passed = rng.random((len(slide_ids), attempts)) < p_ok
+        first_ok = np.argmax(passed, axis=1)
+        # argmax yields 0 for all-False rows; mark those as failed out
+        first_ok[~passed.any(axis=1)] = attempts
+        return first_ok
+
+    def compile_plan(self, is_final_protocol: bool = True,
+                     wash_loops: int = 0) -> List[tuple]:
+        """
+        Compile one protocol pass into a flat, replayable device-call plan.
+
+        Traces the workflow methods once against recording stand-in
+        devices (:class:`_TraceDevice`) with the evaluation outcomes
+        scripted to produce exactly ``wash_loops`` washes, then resolves
+        each recorded call to the bound method of the real device. The
+        per-slide orchestration overhead — scheduler bookkeeping, tag
+        string formatting and retry branching — is paid once here
+        instead of once per slide. Plans are cached keyed by
+        ``(is_final_protocol, wash_loops)``.
+
+        Args:
+            is_final_protocol: Compile the final pass (with quality
+                loop and analysis) or an intermediate stain-and-return
+            wash_loops: Number of failed evaluations to unroll
+
+        Returns:
+            List of ``(method, args, kwargs, expected)`` entries;
+            ``expected`` is the assumed outcome for evaluation calls and
+            ``None`` elsewhere
+        """
+        key = (is_final_protocol, wash_loops)
+        if key not in self._plans:
+            self._plans[key] = asyncio.run(
+                self._trace_plan(is_final_protocol, wash_loops))
+        return self._plans[key]
+
+    async def _trace_plan(self, is_final_protocol: bool, wash_loops: int) -> List[tuple]:
+        """Trace one protocol pass on a scratch orchestrator and record it"""
+        calls = []
+        outcomes = iter([False] * wash_loops + [True])
+        protocol = self.protocols[-1] if is_final_protocol else self.protocols[0]
+        scratch = Orchestrator(
+            robot=_TraceDevice("robot", calls),
+            opentrons=_TraceDevice("opentrons", calls),
+            microscope=_TraceDevice("microscope", calls, outcomes),
+            image_processor=_TraceDevice("image_processor", calls),
+            emit=lambda name, payload: None,
+            max_wash_loops=max(self.max_wash_loops, wash_loops),
+            pickup_slot=self.pickup_slot,
+            ot_slot=self.ot_slot,
+            dropoff_slot=self.dropoff_slot,
+            wash_in_place=self.wash_in_place,
+            protocols=[protocol])
+        scratch._bind_loop()
+        await scratch._process_slide_with_protocol(
+            _TRACE_ID, protocol, is_final_protocol)
+        # Resolve the recorded names to this orchestrator's real devices;
+        # replay always uses the first Opentrons unit of the pool.
+        devices = {"robot": self.robot, "opentrons": self.opentrons,
+                   "microscope": self.microscope,
+                   "image_processor": self.image_processor}
+        return [(getattr(devices[device], method), args, kwargs, expected)
+                for device, method, args, kwargs, expected in calls]
 
-        # Protocol-based workflow: process all slides with each protocol in sequence
+    async def run_compiled(self, slide_id: int, plan: List[tuple] = None,
+                           is_final_protocol: bool = True, wash_loops: int = 0):
+        """
+        Replay a compiled plan for one slide.
+
+        Iterates the plan and awaits each bound device method with the
+        traced slide id substituted, skipping all per-slide scheduling
+        and branching. If a live evaluation disagrees with the compiled
+        assumption the replay stops and the slide is handed back to the
+        dynamic retry loop from its current position, so a mispredicted
+        plan costs only the fallback, never a wrong result. Replay holds
+        no device locks; drive slides one at a time (or mix with dynamic
+        slides under ``run_async``, which does lock).
+
+        Args:
+            slide_id: ID of slide to process
+            plan: Compiled plan; defaults to the cached plan for
+                ``(is_final_protocol, wash_loops)``, compiling on first use
+            is_final_protocol: Plan cache key (ignored if ``plan`` given)
+            wash_loops: Plan cache key (ignored if ``plan`` given)
+        """
+        if plan is None:
+            key = (is_final_protocol, wash_loops)
+            plan = self._plans.get(key)
+            if plan is None:
+                plan = self._plans[key] = await self._trace_plan(
+                    is_final_protocol, wash_loops)
+        if self._sched is None:
+            self._bind_loop()
+
+        protocol = self.protocols[-1] if is_final_protocol else self.protocols[0]
+        self.emit(Ev.ARKITEKT_SLIDE_PROTOCOL_START,
+                  (slide_id, protocol, is_final_protocol))
+
+        washes = 0
+        report = None
+        for method, args, kwargs, expected in plan:
+            args = tuple(slide_id if arg == _TRACE_ID else arg for arg in args)
+            result = await method(*args, **kwargs)
+            if expected is not None and result != expected:
+                await self._resume_diverged(
+                    Slide(id=slide_id, loop_count=washes, is_ok=result), protocol)
+                await self.robot.flush()
+                return
+            if expected is False:
+                washes += 1
+            if method.__name__ == "process_slide":
+                report = result
+
+        if is_final_protocol:
+            self.emit(Ev.ARKITEKT_SLIDE_COMPLETE, (slide_id, washes, report))
+
+        # The recorded plan ends with flush(park=False), so a trailing
+        # safety park is still queued; with no run_async around the
+        # replay to park the arm at workflow end, do it here.
+        await self.robot.flush()
+
+    async def _resume_diverged(self, slide: Slide, protocol: str):
+        """
+        Dynamic fallback when a replayed evaluation defied its plan.
+
+        The slide sits on the microscope with a fresh evaluation result;
+        continue exactly as the dynamic quality loop would.
+        """
+        if slide.is_ok:
+            await self._complete_slide_processing(slide)
+        elif slide.loop_count >= self.max_wash_loops:
+            await self._handle_failed_slide(slide)
+        else:
+            await self._wash_slide(slide, protocol)
+            await self._quality_evaluation_loop(
+                slide, protocol, needs_transfer=not self.wash_in_place)
+
+    async def _process_slide(self, slide_id: int):
+        """Run every protocol in sequence for one slide"""
+        last = len(self.protocols) - 1
         for protocol_index, protocol in enumerate(self.protocols):
-            self.emit("arkitekt.protocol_start", {
-                "protocol": protocol,
-                "protocol_index": protocol_index,
-                "total_protocols": len(self.protocols)
-            })
-            
-            # Set the protocol on Opentrons
-            self.opentrons.set_protocol(protocol)
-            
-            # Process all slides with this protocol
-            for slide_id in slide_ids:
-                self._process_slide_with_protocol(slide_id, protocol, protocol_index == len(self.protocols) - 1)
-            
-            self.emit("arkitekt.protocol_complete", {"protocol": protocol})
-
-        self.emit("arkitekt.workflow_complete", {})
-
-    def _process_slide_with_protocol(self, slide_id: int, protocol: str, is_final_protocol: bool):
+            await self._process_slide_with_protocol(
+                slide_id, protocol, protocol_index == last)
+
+    async def _process_slide_with_protocol(self, slide_id: int, protocol: str, is_final_protocol: bool):
         """
         Process a single slide with the specified protocol.
-        
+
         Args:
             slide_id: ID of slide to process
             protocol: Protocol name to use
             is_final_protocol: True if this is the last protocol in the sequence
         """
         slide = Slide(id=slide_id)
-        
-        self.emit("arkitekt.slide_protocol_start", {
-            "slide": slide_id,
-            "protocol": protocol,
-            "is_final": is_final_protocol
-        })
-
-        # Step 1: Pickup from rack and move to Opentrons
-        self._pickup_slide_to_opentrons(slide)
-        
-        # Step 2: Run staining protocol
-        self.opentrons.run_staining_protocol(slide.id, self.ot_slot, protocol)
-        
-        # Step 3: Quality evaluation loop (only for final protocol)
+        tag = f"slide{slide_id}:{protocol}"
+
+        self.emit(Ev.ARKITEKT_SLIDE_PROTOCOL_START, (slide_id, protocol, is_final_protocol))
+
+        # Pickup and staining form a dependency chain; the scheduler
+        # releases the robot as soon as pickup finishes, so it can serve
+        # the next slide while this one stains.
+        self._sched.submit(Step(
+            f"{tag}/pickup", ("robot",),
+            partial(self._pickup_slide_to_opentrons, slide)))
+        await self._sched.run(Step(
+            f"{tag}/stain", (),
+            partial(self._stain, slide, protocol),
+            deps=(f"{tag}/pickup",)))
+
+        # Quality evaluation loop (only for final protocol)
         if is_final_protocol:
-            self._quality_evaluation_loop(slide)
+            await self._quality_evaluation_loop(slide, protocol)
         else:
             # For intermediate protocols, just move slide back to rack for next protocol
-            self._return_slide_to_rack(slide)
+            await self._sched.run(Step(
+                f"{tag}/return", ("robot",),
+                partial(self._return_slide_to_rack, slide)))
+
+    async def _stain(self, slide: Slide, protocol: str):
+        """Run the staining protocol on the first free Opentrons unit"""
+        ot = await self._ot_free.get()
+        try:
+            await ot.run_staining_protocol(slide.id, self.ot_slot, protocol)
+        finally:
+            self._ot_free.put_nowait(ot)
 
-    def _pickup_slide_to_opentrons(self, slide: Slide):
+    async def _wash(self, slide: Slide, protocol: str):
+        """Run the washing protocol on the first free Opentrons unit"""
+        ot = await self._ot_free.get()
+        try:
+            await ot.run_washing_protocol(slide.id, self.ot_slot, protocol)
+        finally:
+            self._ot_free.put_nowait(ot)
+
+    async def _pickup_slide_to_opentrons(self, slide: Slide):
         """Move slide from rack to Opentrons for staining"""
-        self.robot.move_start_position()
-        self.robot.move_pickup_position(self.pickup_slot)
-        self.robot.close_gripper()
-        self.robot.move_from_rack_to_opentrons(slide.id, self.ot_slot)
-        self.robot.open_gripper()
-        self.robot.move_safety()
-
-    def _return_slide_to_rack(self, slide: Slide):
+        await self.robot.move_start_position()
+        await self.robot.move_pickup_position(self.pickup_slot)
+        await self.robot.close_gripper()
+        await self.robot.move_from_rack_to_opentrons(slide.id, self.ot_slot)
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
+
+    async def _return_slide_to_rack(self, slide: Slide):
         """Return slide to rack after intermediate protocol (not final)"""
-        self.robot.move_from_idle_to_opentrons(slide.id, self.ot_slot)
-        self.robot.close_gripper()
+        await self.robot.move_from_idle_to_opentrons(slide.id, self.ot_slot)
+        await self.robot.close_gripper()
         # For simplicity, we'll put it back in the same rack position
         # In reality, you might have separate positions for different protocol stages
-        self.robot.move_start_position()  # This represents moving back to rack
-        self.robot.open_gripper()
-        self.robot.move_safety()
+        await self.robot.move_start_position()  # This represents moving back to rack
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
 
-    def _quality_evaluation_loop(self, slide: Slide):
+    async def _quality_evaluation_loop(self, slide: Slide, protocol: str,
+                                       needs_transfer: bool = True):
         """
         Quality evaluation loop with washing retry logic.
         Only performed after the final staining protocol.
+
+        Each iteration submits fresh steps; the wash branch is a
+        conditional edge added at runtime when evaluation fails.
+        ``needs_transfer=False`` enters the loop with the slide already
+        on the microscope (used when resuming a diverged replay).
         """
         while True:
+            tag = f"slide{slide.id}:{protocol}:eval{slide.loop_count}"
+
             # Move slide from Opentrons to Microscope for evaluation
-            self.robot.move_from_idle_to_opentrons(slide.id, self.ot_slot)
-            self.robot.close_gripper()
-            self.microscope.safety()
-            self.robot.move_from_opentrons_to_microscope(slide.id, self.ot_slot)
-            self.robot.open_gripper()
-            self.robot.move_safety()
+            # (skipped after an in-place wash: the slide never left)
+            if needs_transfer:
+                await self._sched.run(Step(
+                    f"{tag}/to_microscope", ("robot", "microscope"),
+                    partial(self._move_opentrons_to_microscope, slide)))
 
             # Evaluate slide quality
-            slide.is_ok = self.microscope.evaluate(slide.id)
+            slide.is_ok = await self._sched.run(Step(
+                f"{tag}/evaluate", ("microscope",),
+                partial(self.microscope.evaluate, slide.id)))
 
             if slide.is_ok:
                 # Quality is good - proceed with full processing
-                self._complete_slide_processing(slide)
+                await self._complete_slide_processing(slide)
                 break
 
             # Quality not acceptable - check if we can wash
             if slide.loop_count >= self.max_wash_loops:
                 # Max washes exceeded - slide failed
-                self._handle_failed_slide(slide)
+                await self._handle_failed_slide(slide)
                 break
 
             # Send back for washing
-            self._wash_slide(slide)
+            await self._wash_slide(slide, protocol)
+            needs_transfer = not self.wash_in_place
 
-    def _complete_slide_processing(self, slide: Slide):
+    async def _complete_slide_processing(self, slide: Slide):
         """Complete successful slide processing: scan -> image analysis -> dropoff"""
-        # Full scan
-        self.microscope.scan_slide(slide.id)
-        
-        # Move to image processor
-        self.microscope.safety()
-        self.robot.move_from_idle_to_microscope(slide.id)
-        self.robot.close_gripper()
-        self.robot.move_from_microscope_to_image_processor(slide.id)
-        self.robot.open_gripper()
-        self.robot.move_safety()
-        
-        # Perform image analysis
-        analysis_report = self.image_processor.process_slide(slide.id)
-        
-        # Move to dropoff
-        self.robot.close_gripper()
-        self.robot.move_from_image_processor_to_dropoff(slide.id, self.dropoff_slot)
-        self.robot.open_gripper()
-        self.robot.move_safety()
-        
-        self.emit("arkitekt.slide_complete", {
-            "slide": slide.id, 
-            "loops": slide.loop_count,
-            "analysis": analysis_report
-        })
-
-    def _handle_failed_slide(self, slide: Slide):
+        tag = f"slide{slide.id}:finish"
+
+        self._sched.submit(Step(
+            f"{tag}/scan", ("microscope",),
+            partial(self.microscope.scan_slide, slide.id)))
+        self._sched.submit(Step(
+            f"{tag}/to_image_processor", ("robot", "microscope"),
+            partial(self._move_microscope_to_image_processor, slide),
+            deps=(f"{tag}/scan",)))
+        analysis_report = await self._sched.run(Step(
+            f"{tag}/analyze", ("image_processor",),
+            partial(self.image_processor.process_slide, slide.id),
+            deps=(f"{tag}/to_image_processor",)))
+        await self._sched.run(Step(
+            f"{tag}/dropoff", ("robot",),
+            partial(self._dropoff_from_image_processor, slide)))
+
+        self.emit(Ev.ARKITEKT_SLIDE_COMPLETE, (slide.id, slide.loop_count, analysis_report))
+
+    async def _handle_failed_slide(self, slide: Slide):
         """Handle slide that failed quality evaluation after max wash attempts"""
-        self.emit("arkitekt.slide_failed", {
-            "slide": slide.id, 
-            "loops": slide.loop_count,
-            "reason": "max_wash_loops_exceeded"
-        })
-        
+        self.emit(Ev.ARKITEKT_SLIDE_FAILED, (slide.id, slide.loop_count, "max_wash_loops_exceeded"))
+
         # Move directly to dropoff (or could be moved to reject bin)
-        self.microscope.safety()
-        self.robot.move_from_idle_to_microscope(slide.id)
-        self.robot.close_gripper()
-        self.robot.move_from_microscope_to_dropoff(slide.id, self.dropoff_slot)
-        self.robot.open_gripper()
-        self.robot.move_safety()
-
-    def _wash_slide(self, slide: Slide):
-        """Send slide back to Opentrons for washing"""
-        self.microscope.safety()
-        self.robot.move_from_idle_to_microscope(slide.id)
-        self.robot.close_gripper()
-        self.robot.move_from_microscope_to_opentrons(slide.id, self.ot_slot)
-        self.robot.open_gripper()
-        self.robot.move_safety()
-        
-        # Perform washing
-        self.opentrons.run_washing_protocol(slide.id, self.ot_slot)
+        await self._sched.run(Step(
+            f"slide{slide.id}:reject/dropoff", ("robot", "microscope"),
+            partial(self._dropoff_from_microscope, slide)))
+
+    async def _wash_slide(self, slide: Slide, protocol: str):
+        """Send slide back to Opentrons for washing (or wash in place)"""
+        tag = f"slide{slide.id}:{protocol}:wash{slide.loop_count}"
+
+        if self.wash_in_place:
+            # Fluid delivery happens at the microscope stage, so the
+            # four robot moves of the round-trip are skipped entirely
+            await self._sched.run(Step(
+                f"{tag}/wash", ("microscope",),
+                partial(self._wash, slide, protocol)))
+            slide.loop_count += 1
+            return
+
+        self._sched.submit(Step(
+            f"{tag}/to_opentrons", ("robot", "microscope"),
+            partial(self._move_microscope_to_opentrons, slide)))
+        await self._sched.run(Step(
+            f"{tag}/wash", (),
+            partial(self._wash, slide, protocol),
+            deps=(f"{tag}/to_opentrons",)))
         slide.loop_count += 1
 
-def build_demo(max_wash_loops: int = 2, use_matplotlib: bool = True, **viz_kwargs) -> Orchestrator:
+    async def _move_opentrons_to_microscope(self, slide: Slide):
+        """Robot transfer: Opentrons stage to microscope stage"""
+        await self.robot.move_from_idle_to_opentrons(slide.id, self.ot_slot)
+        await self.robot.close_gripper()
+        await self.robot.flush(park=False)
+        await self.microscope.safety()
+        await self.robot.move_from_opentrons_to_microscope(slide.id, self.ot_slot)
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
+
+    async def _move_microscope_to_opentrons(self, slide: Slide):
+        """Robot transfer: microscope stage back to Opentrons for washing"""
+        await self.microscope.safety()
+        await self.robot.move_from_idle_to_microscope(slide.id)
+        await self.robot.close_gripper()
+        await self.robot.move_from_microscope_to_opentrons(slide.id, self.ot_slot)
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
+
+    async def _move_microscope_to_image_processor(self, slide: Slide):
+        """Robot transfer: microscope stage to image processor"""
+        await self.microscope.safety()
+        await self.robot.move_from_idle_to_microscope(slide.id)
+        await self.robot.close_gripper()
+        await self.robot.move_from_microscope_to_image_processor(slide.id)
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
+
+    async def _dropoff_from_image_processor(self, slide: Slide):
+        """Robot transfer: image processor to dropoff slot"""
+        await self.robot.close_gripper()
+        await self.robot.move_from_image_processor_to_dropoff(slide.id, self.dropoff_slot)
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
+
+    async def _dropoff_from_microscope(self, slide: Slide):
+        """Robot transfer: microscope stage straight to dropoff (failed slide)"""
+        await self.microscope.safety()
+        await self.robot.move_from_idle_to_microscope(slide.id)
+        await self.robot.close_gripper()
+        await self.robot.move_from_microscope_to_dropoff(slide.id, self.dropoff_slot)
+        await self.robot.open_gripper()
+        await self.robot.move_safety()
+        await self.robot.flush(park=False)
+
+def build_demo(max_wash_loops: int = 2, use_matplotlib: bool = True,
+               fast: bool = False, speedup: float = 1.0, **viz_kwargs) -> Orchestrator:
     """
     Build a demo orchestrator with all devices and visualization.
-    
+
     Args:
         max_wash_loops: Maximum number of wash attempts per slide
         use_matplotlib: Whether to use matplotlib visualization
+        fast: Advance simulated device latency without real sleeping
+        speedup: Divide real device sleeps by this factor (ignored if fast)
         **viz_kwargs: Additional arguments for visualizer
-        
+
     Returns:
         Configured Orchestrator instance
     """
-    # Import here to avoid circular imports
-    from .visualizer import create_visualizer
-    
     # Create visualizer
     viz = create_visualizer(use_matplotlib=use_matplotlib, **viz_kwargs)
     emit = viz.on_step
-    
-    # Create devices
-    robot = RobotArm(emit)
-    opentrons = Opentrons(emit)
-    microscope = Microscope(emit)
-    image_processor = ImageProcessor(emit)
-    
+
+    # Create devices sharing one simulated clock
+    clock = SimClock(speedup=speedup, fast=fast)
+    robot = RobotArm(emit, clock)
+    opentrons = Opentrons(emit, clock)
+    microscope = Microscope(emit, clock)
+    image_processor = ImageProcessor(emit, clock)
+
     # Define protocols for multi-step staining
     protocols = ["Receptor42", "Receptor0815"]
-    
+
     # Create orchestrator
     orchestrator = Orchestrator(
         robot=robot,
-        opentrons=opentrons, 
+        opentrons=opentrons,
         microscope=microscope,
         image_processor=image_processor,
         emit=emit,
         max_wash_loops=max_wash_loops,
         protocols=protocols
     )
-    
+
     # Store visualizer reference for cleanup
     orchestrator._visualizer = viz
-    
-    return orchestrator
\ No newline at end of file
+
+    return orchestrator
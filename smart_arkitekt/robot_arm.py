@@ -2,91 +2,116 @@
 Robot Arm device implementation with explicit from->to movement methods.
 """
 
-import time
-from typing import Callable, Dict
+import collections
+from typing import Callable
+
+from .clock import SimClock
+from .events import Ev
 
 class RobotArm:
     """
     Robot Arm with explicit movement methods indicating source and destination.
     All movements are from->to to make the workflow clear.
-    """
-    
-    def __init__(self, emit: Callable[[str, Dict], None]): 
-        self.emit = emit
 
-    # Basic positioning
-    def move_start_position(self):
-        """Move robot to start/idle position"""
-        self.emit("robot.move_start", {}); time.sleep(0.05)
+    Movements are coroutines so transfer latency can overlap with other
+    devices while the arm is the only resource in motion.
 
-    def move_pickup_position(self, slot: int):
-        """Move to pickup position at specified slot"""
-        self.emit("robot.move_pickup", {"slot": slot}); time.sleep(0.05)
-
-    # Gripper control
-    def close_gripper(self):
-        """Close the gripper to grab slide"""
-        self.emit("robot.close_gripper", {}); time.sleep(0.02)
+    Commands pass through a small peephole buffer before executing:
+    a safety park is dropped when another command follows immediately
+    (the arm would leave the park right away), duplicate parks collapse,
+    and an open->close gripper pair with nothing in between is elided.
+    The orchestrator calls :meth:`flush` wherever another device must
+    observe completed arm motion.
+    """
 
-    def open_gripper(self):
-        """Open the gripper to release slide"""
-        self.emit("robot.open_gripper", {}); time.sleep(0.02)
+    __slots__ = ("emit", "clock", "_pending")
 
-    # Explicit from->to movements
-    def move_from_rack_to_opentrons(self, slide_id: int, opentrons_slot: int):
-        """Move slide from rack to opentrons"""
-        self.emit("robot.move_rack_to_opentrons", {
-            "slide": slide_id, 
-            "opentrons_slot": opentrons_slot
-        }); time.sleep(0.1)
+    # Commands queued before the oldest is forced to execute
+    _BUFFER_LIMIT = 4
 
-    def move_from_opentrons_to_microscope(self, slide_id: int, opentrons_slot: int):
-        """Move slide from opentrons to microscope"""
-        self.emit("robot.move_opentrons_to_microscope", {
-            "slide": slide_id,
-            "opentrons_slot": opentrons_slot
-        }); time.sleep(0.1)
+    def __init__(self, emit: Callable[[int, tuple], None], clock: SimClock = None):
+        self.emit = emit
+        self.clock = clock or SimClock()
+        self._pending = collections.deque()
 
-    def move_from_microscope_to_opentrons(self, slide_id: int, opentrons_slot: int):
-        """Move slide from microscope back to opentrons for washing"""
-        self.emit("robot.move_microscope_to_opentrons", {
-            "slide": slide_id,
-            "opentrons_slot": opentrons_slot
-        }); time.sleep(0.1)
+    async def _command(self, kind: int, payload: tuple, duration: float):
+        """Queue one arm command, applying peephole rewrites at the tail"""
+        pending = self._pending
+        if pending:
+            tail_kind = pending[-1][0]
+            if tail_kind == Ev.ROBOT_SAFETY:
+                # Parking right before another command is wasted motion;
+                # this also collapses duplicate parks into one.
+                pending.pop()
+            elif tail_kind == Ev.ROBOT_OPEN_GRIPPER and kind == Ev.ROBOT_CLOSE_GRIPPER:
+                # Releasing and immediately re-grabbing is a no-op pair
+                pending.pop()
+                return
+        pending.append((kind, payload, duration))
+        if len(pending) > self._BUFFER_LIMIT:
+            await self._execute(*pending.popleft())
 
-    def move_from_microscope_to_image_processor(self, slide_id: int):
-        """Move slide from microscope to image processor"""
-        self.emit("robot.move_microscope_to_image_processor", {
-            "slide": slide_id
-        }); time.sleep(0.1)
+    async def _execute(self, kind: int, payload: tuple, duration: float):
+        self.emit(kind, payload)
+        await self.clock.sleep(duration)
 
-    def move_from_image_processor_to_dropoff(self, slide_id: int, dropoff_slot: int):
-        """Move slide from image processor to dropoff"""
-        self.emit("robot.move_image_processor_to_dropoff", {
-            "slide": slide_id,
-            "dropoff_slot": dropoff_slot
-        }); time.sleep(0.1)
+    async def flush(self, park: bool = True):
+        """
+        Execute all queued commands.
 
-    def move_from_microscope_to_dropoff(self, slide_id: int, dropoff_slot: int):
-        """Move slide directly from microscope to dropoff (for failed slides)"""
-        self.emit("robot.move_microscope_to_dropoff", {
-            "slide": slide_id,
-            "dropoff_slot": dropoff_slot
-        }); time.sleep(0.1)
+        Args:
+            park: If False, a trailing safety park stays queued so the
+                next command can elide it; pass True (default) when the
+                arm should genuinely come to rest, e.g. at workflow end
+        """
+        pending = self._pending
+        while pending:
+            if not park and len(pending) == 1 and pending[0][0] == Ev.ROBOT_SAFETY:
+                return
+            await self._execute(*pending.popleft())
 
-    def move_from_idle_to_opentrons(self, slide_id: int, opentrons_slot: int):
-        """Move from idle position to opentrons to pick up slide"""
-        self.emit("robot.move_idle_to_opentrons", {
-            "slide": slide_id,
-            "opentrons_slot": opentrons_slot
-        }); time.sleep(0.1)
+# One row per arm command: (method name, event code, simulated duration,
+# docstring). Positional arguments become the event payload, in
+# events.FIELDS order, so each method body is identical and is
+# generated below instead of written out a dozen times.
+_SPEC = (
+    ("move_start_position", Ev.ROBOT_MOVE_START, 0.05,
+     "Move robot to start/idle position"),
+    ("move_pickup_position", Ev.ROBOT_MOVE_PICKUP, 0.05,
+     "Move to pickup position at specified slot"),
+    ("close_gripper", Ev.ROBOT_CLOSE_GRIPPER, 0.02,
+     "Close the gripper to grab slide"),
+    ("open_gripper", Ev.ROBOT_OPEN_GRIPPER, 0.02,
+     "Open the gripper to release slide"),
+    ("move_from_rack_to_opentrons", Ev.ROBOT_MOVE_RACK_TO_OPENTRONS, 0.1,
+     "Move slide from rack to opentrons"),
+    ("move_from_opentrons_to_microscope", Ev.ROBOT_MOVE_OPENTRONS_TO_MICROSCOPE, 0.1,
+     "Move slide from opentrons to microscope"),
+    ("move_from_microscope_to_opentrons", Ev.ROBOT_MOVE_MICROSCOPE_TO_OPENTRONS, 0.1,
+     "Move slide from microscope back to opentrons for washing"),
+    ("move_from_microscope_to_image_processor", Ev.ROBOT_MOVE_MICROSCOPE_TO_IMAGE_PROCESSOR, 0.1,
+     "Move slide from microscope to image processor"),
+    ("move_from_image_processor_to_dropoff", Ev.ROBOT_MOVE_IMAGE_PROCESSOR_TO_DROPOFF, 0.1,
+     "Move slide from image processor to dropoff"),
+    ("move_from_microscope_to_dropoff", Ev.ROBOT_MOVE_MICROSCOPE_TO_DROPOFF, 0.1,
+     "Move slide directly from microscope to dropoff (for failed slides)"),
+    ("move_from_idle_to_opentrons", Ev.ROBOT_MOVE_IDLE_TO_OPENTRONS, 0.1,
+     "Move from idle position to opentrons to pick up slide"),
+    ("move_from_idle_to_microscope", Ev.ROBOT_MOVE_IDLE_TO_MICROSCOPE, 0.1,
+     "Move from idle position to microscope to pick up slide"),
+    ("move_safety", Ev.ROBOT_SAFETY, 0.03,
+     "Move to safety position"),
+)
 
-    def move_from_idle_to_microscope(self, slide_id: int):
-        """Move from idle position to microscope to pick up slide"""
-        self.emit("robot.move_idle_to_microscope", {
-            "slide": slide_id
-        }); time.sleep(0.1)
+def _make_command(name: str, kind: int, duration: float, doc: str):
+    """Build one arm command method from its _SPEC row"""
+    async def command(self, *args):
+        await self._command(kind, args, duration)
+    command.__name__ = name
+    command.__qualname__ = f"RobotArm.{name}"
+    command.__doc__ = doc
+    return command
 
-    def move_safety(self):
-        """Move to safety position"""
-        self.emit("robot.safety", {}); time.sleep(0.03)
\ No newline at end of file
+for _row in _SPEC:
+    setattr(RobotArm, _row[0], _make_command(*_row))
+del _row
@@ -0,0 +1,72 @@
+"""
+Step scheduler for device workflows.
+
+A workflow is expressed as :class:`Step` objects -- named units of work
+bound to the devices they occupy -- instead of hand-written lock blocks.
+The scheduler runs any submitted step once its dependencies have
+finished and its devices are free, so independent slides pipeline
+across devices without the orchestrator sequencing them by hand.
+Conditional branches (e.g. the wash loop) are expressed by submitting
+new steps at runtime once an evaluation result is known.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Tuple
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Step:
+    """
+    One schedulable unit of work.
+
+    A frozen, slotted record: every slide produces a few dozen of
+    these, so they carry no per-instance dict, and with ``eq=False``
+    they hash and compare by identity instead of field by field --
+    step identity for dependency edges is the ``name`` string, never
+    structural equality.
+
+    Attributes:
+        name: Unique step name within a run (used as a dependency key)
+        devices: Names of devices the step occupies while running
+        action: Zero-argument callable returning the step coroutine
+        deps: Names of steps that must finish before this one starts
+    """
+    name: str
+    devices: Tuple[str, ...]
+    action: Callable[[], Awaitable]
+    deps: Tuple[str, ...] = ()
+
+class Scheduler:
+    """
+    Runs Steps against a fixed set of per-device locks.
+
+    Completion state lives in the scheduler (step name -> task), not on
+    the Step itself, so steps stay immutable graph descriptions.
+    """
+
+    def __init__(self, locks: Dict[str, asyncio.Lock], lock_order: Tuple[str, ...]):
+        self._locks = locks
+        self._lock_rank = {device: rank for rank, device in enumerate(lock_order)}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, step: Step) -> asyncio.Task:
+        """Schedule a step; it starts as soon as its deps and devices allow"""
+        task = asyncio.ensure_future(self._run(step))
+        self._tasks[step.name] = task
+        return task
+
+    async def run(self, step: Step):
+        """Schedule a step and wait for its result"""
+        return await self.submit(step)
+
+    async def _run(self, step: Step):
+        if step.deps:
+            await asyncio.gather(*(self._tasks[dep] for dep in step.deps))
+
+        # Devices are always acquired in the global lock order, so two
+        # compound steps can never deadlock against each other.
+        async with AsyncExitStack() as stack:
+            for device in sorted(step.devices, key=self._lock_rank.__getitem__):
+                await stack.enter_async_context(self._locks[device])
+            return await step.action()
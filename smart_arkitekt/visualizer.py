@@ -5,63 +5,235 @@ Provides both console output and optional matplotlib-based live visualization
 showing stations and active operations.
 """
 
-from typing import Dict, Tuple, Optional
+from typing import Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import collections
+import io
+import sys
 import threading
 import time
 import os
+from types import MappingProxyType
 
-# Try to import matplotlib, handle gracefully if not available
-try:
-    import matplotlib
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    # Use non-GUI backend for headless environments
-    #matplotlib.use('Agg')
-    
-    
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    matplotlib = None
-    plt = None
-    patches = None
+from .events import Ev, FIELDS, NAMES, STATIONS
+from .models import Station
+
+# Matplotlib costs hundreds of milliseconds and tens of MB to import, so
+# it is only loaded inside MatplotlibVisualizer.__init__; availability is
+# probed through the import machinery without importing anything.
+@lru_cache(maxsize=1)
+def _matplotlib_available() -> bool:
+    """Check whether matplotlib can be imported, without importing it"""
+    import importlib.util
+    return importlib.util.find_spec('matplotlib') is not None
+
+def _write_png(buf: bytes, size: Tuple[int, int], path: str):
+    """Encode and write one pre-rendered RGBA frame; runs on the IO pool"""
+    from PIL import Image
+    # compress_level=1 trades a slightly bigger file for much cheaper zlib work
+    Image.frombuffer("RGBA", size, buf).save(path, optimize=False, compress_level=1)
+
+# Event-name prefix (the part before '.') -> workflow station.
+# arkitekt events are system-wide and highlight no station.
+_PREFIX_TO_STATION = {
+    'robot': Station.ROBOT,
+    'opentrons': Station.OPENTRONS,
+    'microscope': Station.MICROSCOPE,
+    'image_processor': Station.IMAGE_PROCESSOR,
+    'arkitekt': None,
+}
+
+# Prebound console-line template shared by all event formatting
+_FMT = "[{:15}] {:30} ".format
+
+# Per-code lookup tables built once at import: the station to highlight
+# and the preformatted '[STATION] name' console prefix, so the hot path
+# indexes a tuple instead of splitting and upper-casing the event name.
+_STATIONS = tuple(_PREFIX_TO_STATION[prefix] for prefix in STATIONS)
+_PREFIXES = tuple(_FMT(prefix.upper(), name)
+                  for prefix, name in zip(STATIONS, NAMES))
+
+# Workflow milestones whose lines should reach the terminal promptly
+# instead of waiting for the batch threshold or timer.
+_FLUSH_EVENTS = frozenset({
+    Ev.ARKITEKT_SLIDE_COMPLETE,
+    Ev.ARKITEKT_SLIDE_FAILED,
+    Ev.ARKITEKT_WORKFLOW_COMPLETE,
+})
+
+def _format_event(code: int, payload: tuple) -> str:
+    """Format a single event as a console line"""
+    fields = FIELDS[code]
+    if fields and len(fields) == len(payload):
+        body = ' '.join(f"{field}={value!r}" for field, value in zip(fields, payload))
+    else:
+        body = '' if not payload else repr(payload)
+    return f"{_PREFIXES[code]}{body}\n"
+
+class EventRing:
+    """
+    Ring buffer that batches emitted events into a single stdout write.
+
+    Devices/visualizers append (code, payload) tuples; a daemon consumer
+    thread drains the ring and writes one joined string per batch, instead
+    of paying one write syscall per event. Flushes happen when the batch
+    threshold is reached, on a short timer, and on close().
+    """
+
+    def __init__(self,
+                 write: Callable[[str], int] = None,
+                 fmt: Callable[[int, tuple], str] = _format_event,
+                 maxlen: int = 4096,
+                 batch_size: int = 64,
+                 flush_interval: float = 0.01,
+                 flush_every: int = 64):
+        self._ring = collections.deque(maxlen=maxlen)
+        self._fmt = fmt
+        self._write = write
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._flush_every = flush_every
+        self._out = None  # lazily created block-buffered stdout wrapper
+        self._events_since_flush = 0
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._consumer = threading.Thread(target=self._drain_loop, daemon=True)
+        self._consumer.start()
+
+    def append(self, code: int, payload: tuple):
+        """Queue one event for batched output"""
+        self._ring.append((code, payload))
+        if len(self._ring) >= self._batch_size or code in _FLUSH_EVENTS:
+            self._wakeup.set()
+
+    def _drain_loop(self):
+        while not self._closed:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self):
+        if not self._ring:
+            return
+        lines = []
+        force_flush = False
+        while True:
+            try:
+                code, payload = self._ring.popleft()
+            except IndexError:
+                break
+            lines.append(self._fmt(code, payload))
+            force_flush = force_flush or code in _FLUSH_EVENTS
+
+        if self._write is not None:
+            self._write(''.join(lines))
+            return
+
+        # Write through a block-buffered wrapper so a line-buffered (TTY)
+        # stdout doesn't pay one flush per newline; we flush explicitly
+        # every flush_every events and on close() instead.
+        if self._out is None:
+            buffer = getattr(sys.stdout, 'buffer', None)
+            if buffer is not None:
+                self._out = io.TextIOWrapper(buffer, line_buffering=False,
+                                             write_through=False)
+        out = self._out if self._out is not None else sys.stdout
+        out.write(''.join(lines))
+        self._events_since_flush += len(lines)
+        if force_flush or self._events_since_flush >= self._flush_every:
+            out.flush()
+            self._events_since_flush = 0
+
+    def flush(self):
+        """Synchronously drain any buffered events"""
+        self._drain()
+
+    def close(self):
+        """Stop the consumer thread and flush remaining events"""
+        self._closed = True
+        self._wakeup.set()
+        self._consumer.join(timeout=1.0)
+        self._drain()
+        if self._out is not None:
+            self._out.flush()
+            # Detach so garbage collection of the wrapper can't close the
+            # underlying stdout buffer.
+            self._out.detach()
+            self._out = None
 
 class MatplotlibVisualizer:
     """
     2D Matplotlib visualization showing stations and current action.
     Handles headless mode gracefully and provides simple station layout.
     """
-    
+
+    # Shared immutable arrow styling; annotate copies it before use
+    _ARROW_KW = MappingProxyType({'arrowstyle': '->', 'color': 'gray', 'alpha': 0.5})
+
+    # Workflow direction edges drawn once as background arrows
+    # (transfers between non-adjacent stations go via ROBOT)
+    _WORKFLOW_EDGES = (
+        (Station.RACK, Station.ROBOT),
+        (Station.ROBOT, Station.OPENTRONS),
+        (Station.OPENTRONS, Station.MICROSCOPE),
+        (Station.MICROSCOPE, Station.IMAGE_PROCESSOR),
+        (Station.IMAGE_PROCESSOR, Station.DROPOFF),
+    )
+
     def __init__(self, headless: bool = None, save_frames: bool = False):
-        if not MATPLOTLIB_AVAILABLE:
+        if not _matplotlib_available():
             raise ImportError("matplotlib is not available")
             
         if headless is None:
             # Auto-detect headless environment
             headless = 'DISPLAY' not in os.environ or os.environ.get('DISPLAY', '') == ''
-            
+
+        # Deferred import: console-only runs never pay for matplotlib
+        import matplotlib
+        if headless:
+            # Use non-GUI backend for headless environments
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+        self._plt = plt
+        self._patches = patches
+        
         self.headless = headless
         self.save_frames = save_frames
         self.frame_count = 0
+        # PNG encoding + disk IO happen off the event path on this pool
+        self._io_pool = ThreadPoolExecutor(max_workers=2) if save_frames else None
         
-        # Station positions (x, y) - layout with image processor
+        # Station positions (x, y) - layout with image processor.
+        # Keyed by the Station IntEnum so hot-path lookups are by integer.
         self.stations = {
-            'RACK': (1, 4),
-            'ROBOT': (3, 3),
-            'OPENTRONS': (5, 4),
-            'MICROSCOPE': (5, 2),
-            'IMAGE_PROCESSOR': (3, 1),
-            'DROPOFF': (1, 2)
+            Station.RACK: (1, 4),
+            Station.ROBOT: (3, 3),
+            Station.OPENTRONS: (5, 4),
+            Station.MICROSCOPE: (5, 2),
+            Station.IMAGE_PROCESSOR: (3, 1),
+            Station.DROPOFF: (1, 2)
         }
         
         self.active_station = None
         self.current_action = ""
+        self._ring = EventRing()
+
+        # Redraws are coalesced: events only mark the plot dirty and the
+        # actual draw happens at most max_fps times per second
+        self.max_fps = 30.0
+        self._dirty = False
+        self._last_draw = 0.0
         
         if not self.headless:
             plt.ion()  # Interactive mode
-            
-        self.fig, self.ax = plt.subplots(figsize=(8, 6))
+
+        # Fixed size and low dpi keep per-frame rasterization cheap; the
+        # layout is computed once here since the plot geometry never changes
+        self.fig, self.ax = plt.subplots(figsize=(8, 6), dpi=72)
         self._setup_plot()
+        self.fig.tight_layout()
         
         # Show the initial plot
         if not self.headless:
@@ -69,133 +241,145 @@ class MatplotlibVisualizer:
             plt.draw()
         
     def _setup_plot(self):
-        """Initialize the static elements of the plot"""
-        self.ax.clear()
+        """Initialize the static elements of the plot (done once)"""
         self.ax.set_xlim(0, 6)
         self.ax.set_ylim(0, 5)
         self.ax.set_aspect('equal')
         self.ax.set_title('Multi-Device Workflow Status')
-        
-        # Draw station circles and labels
+
+        # Draw station circles and labels, keeping the artists around so
+        # updates only mutate them instead of rebuilding the whole plot
+        self._station_circles = {}
         for station, (x, y) in self.stations.items():
-            circle = patches.Circle((x, y), 0.3, 
-                                  facecolor='lightblue', 
-                                  edgecolor='black', 
+            circle = self._patches.Circle((x, y), 0.3,
+                                  facecolor='lightblue',
+                                  edgecolor='black',
                                   linewidth=1)
             self.ax.add_patch(circle)
-            self.ax.text(x, y-0.6, station, ha='center', fontsize=8, weight='bold')
-            
+            self._station_circles[station] = circle
+            self.ax.text(x, y-0.6, station.name, ha='center', fontsize=8, weight='bold')
+
         # Add arrows showing workflow direction
         self._draw_workflow_arrows()
+
+        # Persistent highlight circle and action text, mutated per update
+        self._active_circle = self._patches.Circle((0, 0), 0.35,
+                                             facecolor='yellow',
+                                             edgecolor='red',
+                                             linewidth=3,
+                                             alpha=0.8,
+                                             visible=False)
+        self.ax.add_patch(self._active_circle)
+        self._action_text = self.ax.text(3, 0.3, "",
+                                         ha='center', fontsize=10, weight='bold',
+                                         bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow"),
+                                         visible=False)
         
     def _draw_workflow_arrows(self):
         """Draw arrows showing the workflow direction between stations"""
-        # RACK -> ROBOT
-        self.ax.annotate('', xy=self.stations['ROBOT'], xytext=self.stations['RACK'],
-                        arrowprops=dict(arrowstyle='->', color='gray', alpha=0.5))
-        
-        # ROBOT -> OPENTRONS  
-        self.ax.annotate('', xy=self.stations['OPENTRONS'], xytext=self.stations['ROBOT'],
-                        arrowprops=dict(arrowstyle='->', color='gray', alpha=0.5))
-        
-        # OPENTRONS -> MICROSCOPE (via ROBOT)
-        self.ax.annotate('', xy=self.stations['MICROSCOPE'], xytext=self.stations['OPENTRONS'],
-                        arrowprops=dict(arrowstyle='->', color='gray', alpha=0.5))
-        
-        # MICROSCOPE -> IMAGE_PROCESSOR (via ROBOT)
-        self.ax.annotate('', xy=self.stations['IMAGE_PROCESSOR'], xytext=self.stations['MICROSCOPE'],
-                        arrowprops=dict(arrowstyle='->', color='gray', alpha=0.5))
-        
-        # IMAGE_PROCESSOR -> DROPOFF (via ROBOT)
-        self.ax.annotate('', xy=self.stations['DROPOFF'], xytext=self.stations['IMAGE_PROCESSOR'],
-                        arrowprops=dict(arrowstyle='->', color='gray', alpha=0.5))
+        for origin, destination in self._WORKFLOW_EDGES:
+            self.ax.annotate('', xy=self.stations[destination],
+                             xytext=self.stations[origin],
+                             arrowprops=self._ARROW_KW)
         
-    def _get_station_from_action(self, action_name: str) -> Optional[str]:
-        """Map action names to station names"""
-        if action_name.startswith('robot'):
-            return 'ROBOT'
-        elif action_name.startswith('opentrons'):
-            return 'OPENTRONS'
-        elif action_name.startswith('microscope'):
-            return 'MICROSCOPE'
-        elif action_name.startswith('image_processor'):
-            return 'IMAGE_PROCESSOR'
-        elif action_name.startswith('arkitekt'):
-            return None  # System-wide actions
-        else:
-            return None
-            
-    def on_step(self, name: str, payload: Dict):
+    def on_step(self, code: int, payload: tuple):
         """Handle workflow step events"""
-        # Console output (always enabled)
-        station = (name.split('.', 1)[0] if '.' in name else name).upper()
-        print(f"[{station:15}] {name:30} {payload}")
-        
-        # Update matplotlib visualization
-        self.active_station = self._get_station_from_action(name)
-        self.current_action = name
+        # Console output (always enabled, batched through the ring)
+        self._ring.append(code, payload)
+
+        # Update matplotlib visualization (coalesced, rate-limited)
+        self.active_station = _STATIONS[code]
+        self.current_action = NAMES[code]
+        self._dirty = True
+        self._maybe_redraw()
+
+    def _maybe_redraw(self):
+        """Redraw the plot if it is dirty and the frame budget allows it"""
+        if not self._dirty:
+            return
+        now = time.monotonic()
+        if now - self._last_draw < 1.0 / self.max_fps:
+            return  # Coalesce with a later event's redraw
+        self._last_draw = now
+        self._dirty = False
         self._update_plot()
         
     def _update_plot(self):
         """Update the matplotlib visualization with current state"""
-        self._setup_plot()  # Redraw base elements
-        
-        # Highlight active station
-        if self.active_station and self.active_station in self.stations:
-            x, y = self.stations[self.active_station]
-            active_circle = patches.Circle((x, y), 0.35, 
-                                         facecolor='yellow', 
-                                         edgecolor='red', 
-                                         linewidth=3,
-                                         alpha=0.8)
-            self.ax.add_patch(active_circle)
-            
+        # Nothing is displayed or saved in this mode, so skip rendering
+        if self.headless and not self.save_frames:
+            return
+
+        # Only mutate the persistent artists; the static stations, labels
+        # and arrows drawn in _setup_plot are never rebuilt
+        if self.active_station is not None and self.active_station in self.stations:
+            self._active_circle.set_center(self.stations[self.active_station])
+            self._active_circle.set_visible(True)
+        else:
+            self._active_circle.set_visible(False)
+
         # Show current action
         if self.current_action:
-            self.ax.text(3, 0.3, f"Current: {self.current_action}", 
-                        ha='center', fontsize=10, weight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow"))
-        
+            self._action_text.set_text(f"Current: {self.current_action}")
+            self._action_text.set_visible(True)
+
         # Update display
         if not self.headless:
-            plt.show()  # Ensure window is visible
-            plt.draw()
-            plt.pause(0.01)  # Brief pause for animation effect
+            self.fig.canvas.draw_idle()
+            self._plt.pause(0.01)  # Brief pause for animation effect
             
-        # Save frame if requested
+        # Save frame if requested: render once, then hand the RGBA buffer
+        # to the IO pool so encoding and the disk write overlap with the
+        # next workflow step instead of blocking it
         if self.save_frames:
-            self.fig.savefig(f'/tmp/workflow_frame_{self.frame_count:04d}.png', 
-                           dpi=100, bbox_inches='tight')
+            self.fig.canvas.draw()
+            buf = bytes(self.fig.canvas.buffer_rgba())
+            size = self.fig.canvas.get_width_height()
+            self._io_pool.submit(
+                _write_png, buf, size,
+                f'/tmp/workflow_frame_{self.frame_count:04d}.png')
             self.frame_count += 1
             
     def close(self):
         """Clean up visualization resources"""
+        # Make sure the final state gets drawn/saved even if it was coalesced
+        if self._dirty:
+            self._dirty = False
+            self._update_plot()
+        self._ring.close()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
         if not self.headless:
-            plt.ioff()
-        plt.close(self.fig)
+            self._plt.ioff()
+        self._plt.close(self.fig)
 
 class ConsoleVisualizer:
     """Simple console-only visualizer for environments without matplotlib"""
     
     def __init__(self):
-        pass
+        self._ring = EventRing()
         
-    def on_step(self, name: str, payload: Dict):
-        station = (name.split('.', 1)[0] if '.' in name else name).upper()
-        print(f"[{station:15}] {name:30} {payload}")
+    def on_step(self, code: int, payload: tuple):
+        self._ring.append(code, payload)
         
     def close(self):
-        pass
+        self._ring.close()
 
 def create_visualizer(use_matplotlib: bool = True, **kwargs):
     """Factory function to create appropriate visualizer"""
-    if use_matplotlib and MATPLOTLIB_AVAILABLE:
+    # Headless with no frame saving means matplotlib output would never be
+    # seen; the console visualizer covers everything that is observable.
+    if use_matplotlib and kwargs.get('headless') and not kwargs.get('save_frames'):
+        print("Note: headless mode without frame saving, using console visualizer")
+        return ConsoleVisualizer()
+
+    if use_matplotlib and _matplotlib_available():
         try:
             return MatplotlibVisualizer(**kwargs)
         except ImportError:
             print("Warning: matplotlib not available, falling back to console visualizer")
             return ConsoleVisualizer()
     else:
-        if use_matplotlib and not MATPLOTLIB_AVAILABLE:
+        if use_matplotlib and not _matplotlib_available():
             print("Warning: matplotlib not available, falling back to console visualizer")
         return ConsoleVisualizer()
\ No newline at end of file
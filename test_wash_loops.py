@@ -6,25 +6,32 @@ This script temporarily modifies the microscope evaluation to demonstrate
 wash loops with a more predictable outcome.
 """
 
-import random
+import time
+
+from smart_arkitekt.clock import SimClock
 from smart_arkitekt.microscope import Microscope
+from smart_arkitekt.visualizer import create_visualizer
+from smart_arkitekt.orchestrator import Orchestrator
+from smart_arkitekt.robot_arm import RobotArm
+from smart_arkitekt.opentrons import Opentrons
+from smart_arkitekt.image_processor import ImageProcessor
 
-class TestMicroscope(Microscope):
-    """Test microscope with predictable evaluation results for testing wash loops"""
-    
-    def __init__(self, emit, fail_first_n_evaluations: int = 2):
-        super().__init__(emit)
+class FailFirstEvaluator:
+    """Quality policy with predictable results for testing wash loops.
+
+    Injected via ``Microscope(evaluator=...)`` so the microscope's own
+    event bookkeeping (emit, clock, safety debounce) stays intact.
+    """
+
+    def __init__(self, fail_first_n_evaluations: int = 2):
         self.evaluation_count = 0
         self.fail_first_n_evaluations = fail_first_n_evaluations
 
-    def evaluate(self, slide_id: int) -> bool:
-        self.emit("microscope.evaluate", {"slide": slide_id})
-        import time; time.sleep(0.1)
-        
+    def __call__(self, slide_id: int) -> bool:
         self.evaluation_count += 1
         # Fail first N evaluations to force wash loops, then succeed
         result = self.evaluation_count > self.fail_first_n_evaluations
-        
+
         print(f"    📊 Evaluation #{self.evaluation_count} for slide {slide_id}: {'✅ OK' if result else '❌ NOT OK'}")
         return result
 
@@ -34,23 +41,19 @@ def test_wash_loops():
     print("   Will force first 2 evaluations to fail, then succeed")
     print("=" * 60)
     
-    # Import here to avoid circular imports
-    from smart_arkitekt.visualizer import create_visualizer
-    from smart_arkitekt.orchestrator import Orchestrator
-    from smart_arkitekt.robot_arm import RobotArm
-    from smart_arkitekt.opentrons import Opentrons
-    from smart_arkitekt.image_processor import ImageProcessor
-    
     # Create visualizer (console only for testing)
     viz = create_visualizer(use_matplotlib=False)
-    
+
     try:
-        # Create devices with test microscope
+        # Create devices with a scripted evaluator; the fast clock only
+        # advances virtual time, so the test completes in milliseconds
         emit = viz.on_step
-        robot = RobotArm(emit)
-        opentrons = Opentrons(emit)
-        scope = TestMicroscope(emit, fail_first_n_evaluations=2)
-        image_processor = ImageProcessor(emit)
+        clock = SimClock(fast=True)
+        robot = RobotArm(emit, clock)
+        opentrons = Opentrons(emit, clock)
+        scope = Microscope(emit, clock,
+                           evaluator=FailFirstEvaluator(fail_first_n_evaluations=2))
+        image_processor = ImageProcessor(emit, clock)
         
         # Create orchestrator with max 3 wash loops
         orchestrator = Orchestrator(
@@ -64,7 +67,6 @@ def test_wash_loops():
         )
         
         # Run the workflow with single slide
-        import time
         start_time = time.time()
         orchestrator.run([1])
         end_time = time.time()